@@ -7,23 +7,250 @@ calculate profits at exit, and export comprehensive trade statistics to JSON.
 Features:
 1. Capture last candle OHLCV + indicators when trades enter
 2. Store profit when trades exit
-3. Auto-save to JSON on each trade exit (crash-safe)
+3. Append each trade exit to an NDJSON log (crash-safe)
 4. Batch export after backtest completes
 5. Summary statistics and analysis
 """
 
-import json
+import base64
 import logging
+import os
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+import orjson
 import pandas as pd
 from freqtrade.persistence import Trade, Order
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, NumPy reductions are used instead
+    njit = None
+
 
 logger = logging.getLogger(__name__)
 
+# (enter_tag, pair, open_date_utc) - hashed directly, formatted only for export
+TradeKey = Tuple[str, str, datetime]
+
+
+# Float columns packed into the float64 block of NDJSON log records; integer
+# columns (volume, enter_long, ...) stay plain ints like Series.to_dict() gives
+_NUMERIC_SCHEMA_TYPES = (np.float64, np.float32)
+
+# orjson serializes numpy scalars, NaN (as null) and datetimes natively;
+# non-str keys (e.g. integer candle column names) are accepted like json.dump does
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Serialize a value orjson does not handle natively.
+    
+    orjson only calls this for unsupported types such as pd.Timestamp,
+    pd.NaT and pd.NA, so natively supported values pay nothing. Float
+    scalars (e.g. np.float16) are resolved with a NaN self-comparison
+    before falling through to pd.isna.
+    """
+    if isinstance(value, (float, np.floating)):
+        return None if value != value else float(value)
+    if value is pd.NaT:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if pd.isna(value):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _append_to_log(fd: int, payload: bytes) -> None:
+    """
+    Append a batch of NDJSON lines to the log and fsync it (writer thread).
+    
+    os.write may write less than asked (e.g. when the disk fills up), so it
+    is repeated until the whole batch is written. If a write fails, the log
+    is truncated back to where the batch started so it never ends in a
+    partial line.
+    """
+    start = None
+    try:
+        start = os.fstat(fd).st_size
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    except OSError as e:
+        logger.error(f"Error during incremental save: {str(e)}", exc_info=True)
+        if start is not None:
+            try:
+                os.ftruncate(fd, start)
+            except OSError:
+                pass
+
+
+def _write_file(path: Path, payload: bytes) -> None:
+    """
+    Write a fully serialized export to path (writer thread).
+    
+    The payload goes to a '.tmp' sibling first and is renamed over path with
+    os.replace, which is atomic on POSIX and Windows: a crash mid-write never
+    leaves a truncated export behind.
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _reduce_profits_loop(p: np.ndarray, n: int) -> Tuple[int, int, int, float, float, float]:
+    """
+    Reduce the first n profits in a single pass, skipping NaN (not exited) values.
+    
+    Args:
+        p (np.ndarray): Profit ratio column
+        n (int): Number of stored trades
+        
+    Returns:
+        Tuple: (positive, negative, zero, total, min, max)
+    """
+    pos = 0
+    neg = 0
+    zero = 0
+    total = 0.0
+    mn = np.inf
+    mx = -np.inf
+    for i in range(n):
+        v = p[i]
+        if np.isnan(v):
+            continue
+        if v > 0:
+            pos += 1
+        elif v < 0:
+            neg += 1
+        else:
+            zero += 1
+        total += v
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+    return pos, neg, zero, total, mn, mx
+
+
+def _reduce_profits_numpy(p: np.ndarray, n: int) -> Tuple[int, int, int, float, float, float]:
+    """NumPy fallback for _reduce_profits_loop when numba is not installed."""
+    profits = p[:n][~np.isnan(p[:n])]
+    if not len(profits):
+        return 0, 0, 0, 0.0, np.inf, -np.inf
+    return (
+        int((profits > 0).sum()),
+        int((profits < 0).sum()),
+        int((profits == 0).sum()),
+        float(profits.sum()),
+        float(profits.min()),
+        float(profits.max()),
+    )
+
+
+class _NdjsonLog:
+    """
+    Working NDJSON log of a collector: its path, open fd and the exits not yet written.
+    
+    Holds no reference to the collector, so the collector's finalizer can
+    still write the pending batch and close the fd when the collector is
+    garbage collected (or the interpreter exits) before on_backtest_end().
+    """
+    
+    def __init__(self) -> None:
+        self.path: Optional[Path] = None
+        self.fd: Optional[int] = None
+        # Serialized line per exited row, with the numeric columns packed into it
+        self.pending: Dict[int, Tuple[tuple, bytes]] = {}
+        # Numeric columns announced in the current file
+        self.logged_numeric_keys: Optional[tuple] = None
+    
+    def start(self, path: Path) -> None:
+        """Point the log at a new (not yet created) file for the next run."""
+        self.close()
+        self.path = path
+        self.logged_numeric_keys = None
+    
+    def open(self) -> int:
+        """Open the file once and keep appending to it."""
+        if self.fd is None:
+            self.fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        return self.fd
+    
+    def take_batch(self) -> bytes:
+        """
+        Remove the pending lines and join them in row order.
+        
+        A {"numeric_schema": [...]} line goes before the first line packed
+        with a different set of numeric columns than the file announced last.
+        
+        Returns:
+            bytes: NDJSON lines for the batch
+        """
+        lines = []
+        for idx in sorted(self.pending):
+            numeric_keys, line = self.pending[idx]
+            if numeric_keys and numeric_keys != self.logged_numeric_keys:
+                lines.append(orjson.dumps(
+                    {'numeric_schema': numeric_keys},
+                    default=_json_default,
+                    option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE,
+                ))
+                self.logged_numeric_keys = numeric_keys
+            lines.append(line)
+        self.pending.clear()
+        return b''.join(lines)
+    
+    def close(self) -> None:
+        """Close the fd if it is open."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def _finalize_collector(writer_pool: ThreadPoolExecutor, log: _NdjsonLog) -> None:
+    """
+    Finish a collector's file writes once it is garbage collected or at exit.
+    
+    Waits for queued writes, appends the exits still pending and closes the
+    NDJSON log. Registered with weakref.finalize, so it only gets the pool
+    and the log, never the collector itself.
+    """
+    writer_pool.shutdown(wait=True)
+    try:
+        if log.pending:
+            _append_to_log(log.open(), log.take_batch())
+        log.close()
+    except OSError as e:
+        logger.error(f"Error during incremental save: {str(e)}", exc_info=True)
+
+
+if njit is not None:
+    # All fastmath flags except 'nnan'/'ninf': the loop relies on NaN checks and inf sentinels
+    _reduce_profits = njit(cache=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})(
+        _reduce_profits_loop
+    )
+else:
+    _reduce_profits = _reduce_profits_numpy
+
 
 class DataframeTradeStatistics:
     """
@@ -36,17 +263,21 @@ class DataframeTradeStatistics:
     Features:
     - Capture last candle (current entry point) on each buy order fill
     - Store exit profit on each trade exit
-    - Auto-save to JSON after each trade (configurable)
+    - Append each exited trade to an NDJSON log (configurable)
     - Batch export after backtest completes
     - Summary statistics calculation
     
     Attributes:
         enabled (bool): Whether to collect trade statistics
-        auto_save_on_exit (bool): Whether to write JSON after each trade exit
+        auto_save_on_exit (bool): Whether to append each trade exit to the NDJSON log
         output_dir (Path): Directory for statistics files
-        trade_data (Dict): Storage for trade dataframes and profits
+        trade_data (Dict): Trade dataframes and profits keyed by trade key (read-only view)
     """
     
+    # Scalar trade fields kept in column arrays; NaN marks a value not yet set
+    _FLOAT_COLUMNS = ('entry_price', 'amount', 'profit', 'profit_abs', 'exit_price')
+    _INITIAL_CAPACITY = 1024
+    
     def __init__(
         self,
         enabled: bool = False,
@@ -59,72 +290,231 @@ class DataframeTradeStatistics:
         
         Args:
             enabled (bool): Whether to enable data collection. Default is False.
-            auto_save_on_exit (bool): If True, writes to JSON file each time a trade exits.
-                                      Provides crash-safe backup. Default is True.
+            auto_save_on_exit (bool): If True, appends one JSON line to an NDJSON log each
+                                      time a trade exits. Provides crash-safe backup. Default is True.
             output_dir (str): Directory for saving statistics files. Default is 'user_data/trade_statistics'.
         """
         self.enabled = enabled
         self.auto_save_on_exit = auto_save_on_exit
         self.output_dir = Path(output_dir)
         self.strategy_name = strategy_name
-        self.trade_data: Dict[str, Dict[str, Any]] = {}
-        self._current_export_file: Optional[Path] = None
+        # NDJSON log state, kept apart so the finalizer can flush it without the collector
+        self._log = _NdjsonLog()
+        self._reset_storage()
+        self._start_export_files()
+        # Candle columns, taken from the first candle seen
+        self._schema_index: Optional[pd.Index] = None
+        self._schema_keys: Optional[tuple] = None
+        self._numeric_keys: tuple = ()
+        
+        # Exits are written together once the batch is full or stale
+        self._flush_threshold = 32
+        self._flush_interval = 5.0  # seconds
+        self._flush_deadline = 0.0
+        
+        # File writes run on a single FIFO worker so they never reorder
+        self._writer_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trade_stats_writer")
+        # Flush, close the log and shut the pool down once the collector is
+        # collected or the interpreter exits, whichever comes first
+        weakref.finalize(self, _finalize_collector, self._writer_pool, self._log)
+        self._pending_writes: Deque[Future] = deque()
+        self._max_pending_writes = 4
         
         # Create output directory if needed
         if self.enabled:
             self.output_dir.mkdir(parents=True, exist_ok=True)
+            # Compile the profit reduction now rather than on the first recount
+            _reduce_profits(np.zeros(1), 1)
         
         logger.info(
             f"DataframeTradeStatistics initialized (enabled={enabled}, "
             f"auto_save_on_exit={auto_save_on_exit}, output_dir={output_dir})"
         )
     
-    def _generate_trade_key(self, enter_tag: Optional[str], pair: str, open_date_utc: datetime) -> str:
+    def _start_export_files(self) -> None:
+        """
+        Fix the output file names for this run.
+        
+        The timestamp is taken once, so the NDJSON log and the default export
+        share one '<strategy_name>_<timestamp>' stem and no exit or export
+        has to format it again. It includes microseconds, so a run started
+        by clear() within the same second gets its own files instead of
+        appending to the previous run's log.
+        """
+        stem = f"{self.strategy_name}_{datetime.now():%Y%m%d_%H%M%S_%f}"
+        self._log.start(self.output_dir / f"{stem}.ndjson")
+        self._default_export_file = self.output_dir / f"{stem}.json"
+    
+    def _reset_storage(self) -> None:
+        """
+        Allocate empty column storage for trade data.
+        
+        Scalar fields live in float64 arrays indexed by trade position, so
+        reductions over them run as single NumPy passes. Candles and string
+        fields are kept in a side list of per-trade dicts.
+        """
+        self._n = 0
+        self._cols: Dict[str, np.ndarray] = {
+            name: np.full(self._INITIAL_CAPACITY, np.nan) for name in self._FLOAT_COLUMNS
+        }
+        self._details: List[Dict[str, Any]] = []
+        self._trade_keys: List[TradeKey] = []
+        self._key_to_idx: Dict[TradeKey, int] = {}
+        # Converted entry candles by (pair, candle date), shared between trades
+        self._candle_cache: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+        
+        # Running profit statistics, updated on every exit
+        self._profit_count = 0
+        self._pos_count = 0
+        self._neg_count = 0
+        self._zero_count = 0
+        self._sum_profit = 0.0
+        self._min_profit = np.inf
+        self._max_profit = -np.inf
+        # Set when an already counted profit is replaced, forces a full recount
+        self._dirty = False
+    
+    def _recount_profits(self) -> None:
+        """Rebuild the running profit statistics from the profit column."""
+        (
+            self._pos_count, self._neg_count, self._zero_count,
+            self._sum_profit, self._min_profit, self._max_profit,
+        ) = _reduce_profits(self._cols['profit'], self._n)
+        self._profit_count = self._pos_count + self._neg_count + self._zero_count
+        self._dirty = False
+    
+    def _grow(self) -> None:
+        """Double the capacity of the column arrays."""
+        for name, column in self._cols.items():
+            grown = np.full(2 * len(column), np.nan)
+            grown[:self._n] = column[:self._n]
+            self._cols[name] = grown
+    
+    def _trade_record(self, idx: int) -> Dict[str, Any]:
+        """
+        Rebuild the exported dictionary of a single trade from column storage.
+        
+        Args:
+            idx (int): Position of the trade in column storage
+            
+        Returns:
+            Dict: Trade entry candle, prices and (once exited) profit data
+        """
+        cols = self._cols
+        details = self._details[idx]
+        record = {
+            'entry_candle': details['entry_candle'],
+            'entry_price': float(cols['entry_price'][idx]),
+            'entry_time': details['entry_time'],
+            'pair': details['pair'],
+            'enter_tag': details['enter_tag'],
+            'amount': float(cols['amount'][idx]),
+            'profit': None,  # Filled once the trade exits
+        }
+        
+        profit = cols['profit'][idx]
+        if profit == profit:  # NaN until the trade exits
+            record.update({
+                'profit': float(profit),
+                'profit_abs': float(cols['profit_abs'][idx]),
+                'exit_price': float(cols['exit_price'][idx]),
+                'exit_reason': details['exit_reason'],
+                'trade_duration_candles': details['trade_duration_candles'],
+            })
+        
+        return record
+    
+    def _trade_records(self) -> Dict[str, Dict[str, Any]]:
+        """All trade records keyed by trade key; entry candles are the stored dicts."""
+        return {
+            self._format_trade_key(key): self._trade_record(idx)
+            for idx, key in enumerate(self._trade_keys)
+        }
+    
+    @property
+    def trade_data(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Trade dataframes and profits keyed by trade key, rebuilt from column storage.
+        
+        Entry candles are copies: trades entered on the same bar share one
+        stored candle dict, so changes made through this view never reach
+        other trades or later exports.
+        """
+        trades = self._trade_records()
+        for record in trades.values():
+            record['entry_candle'] = dict(record['entry_candle'])
+        return trades
+    
+    def _generate_trade_key(self, enter_tag: Optional[str], pair: str, open_date_utc: datetime) -> TradeKey:
         """
         Generate a unique key for a trade.
         
+        The key is a plain tuple, so lookups hash the parts directly instead of
+        formatting a string on every entry and exit.
+        
         Args:
             enter_tag (Optional[str]): The enter tag from the trade
             pair (str): Trading pair (e.g., 'BTC/USDT')
             open_date_utc (datetime): UTC timestamp when trade was opened
             
         Returns:
-            str: Formatted trade key
+            TradeKey: (enter_tag or 'no_tag', pair, open_date_utc)
         """
-        enter_tag_str = enter_tag if enter_tag else "no_tag"
-        timestamp = open_date_utc.isoformat()
-        return f"{enter_tag_str}_{pair}_{timestamp}"
+        return (enter_tag or "no_tag", pair, open_date_utc)
+    
+    @staticmethod
+    def _format_trade_key(trade_key: TradeKey) -> str:
+        """
+        Format a trade key as the string used in exported files.
+        
+        Args:
+            trade_key (TradeKey): Key from _generate_trade_key()
+            
+        Returns:
+            str: Formatted trade key, e.g. 'no_tag_BTC/USDT_2026-01-01T12:00:00+00:00'
+        """
+        return f"{trade_key[0]}_{trade_key[1]}_{trade_key[2].isoformat()}"
+    
+    def _build_schema(self, candle: pd.Series) -> None:
+        """
+        Cache the candle columns and which of them are float columns.
+        
+        All candles of a strategy share the same columns, so this only runs
+        when the column index changes.
+        
+        Args:
+            candle (pd.Series): A single candle (last row from dataframe)
+        """
+        self._schema_index = candle.index
+        self._schema_keys = tuple(candle.index)
+        self._numeric_keys = tuple(
+            key for key, value in zip(candle.index, candle.to_numpy())
+            if type(value) in _NUMERIC_SCHEMA_TYPES
+        )
     
     def _convert_candle_to_dict(self, candle: Union[pd.Series, Dict]) -> Dict[str, Any]:
         """
-        Convert a pandas Series (single candle) to a JSON-serializable dictionary.
+        Convert a pandas Series (single candle) to a dictionary.
+        
+        Values are kept as they are, so integer columns stay ints: orjson
+        serializes numpy scalars, NaN and datetimes natively, and
+        _json_default() covers the rest at export.
+        Series input skips .to_dict() and zips the raw values with the cached
+        column names from _build_schema().
         
         Args:
             candle (Union[pd.Series, Dict]): A single candle (last row from dataframe)
             
         Returns:
-            Dict: Serializable dictionary with candle data
+            Dict: Dictionary with candle data
         """
-        if isinstance(candle, pd.Series):
-            candle_dict = candle.to_dict()
-        else:
-            candle_dict = dict(candle)
-        
-        # Convert datetime values to strings
-        result = {}
-        for key, value in candle_dict.items():
-            if isinstance(value, pd.Timestamp):
-                result[key] = value.isoformat()
-            elif isinstance(value, datetime):
-                result[key] = value.isoformat()
-            elif pd.isna(value):
-                result[key] = None
-            elif hasattr(value, 'item'):  # numpy types
-                result[key] = float(value) if isinstance(value, (float, int)) or 'float' in str(type(value)) or 'int' in str(type(value)) else str(value)
-            else:
-                result[key] = value
+        if not isinstance(candle, pd.Series):
+            return dict(candle)
         
-        return result
+        if self._schema_index is None or not candle.index.equals(self._schema_index):
+            self._build_schema(candle)
+        
+        return dict(zip(self._schema_keys, candle.to_numpy()))
     
     def store_entry_dataframe(
         self,
@@ -137,7 +527,7 @@ class DataframeTradeStatistics:
         Store the last candle (entry point) when a buy order is filled (trade entered).
         
         Called from order_filled() when a buy order closes.
-        Expects a single candle (Series/dict), typically: dataframe.iloc[-1].squeeze()
+        Expects a single candle (Series/dict), typically: dataframe.iloc[-1]
         
         Args:
             pair (str): Trading pair (e.g., 'BTC/USDT')
@@ -149,23 +539,67 @@ class DataframeTradeStatistics:
             return
         
         try:
-            trade_key = self._generate_trade_key(trade.enter_tag, pair, trade.open_date_utc)
+            # Bind attributes used more than once on this per-trade path
+            enter_tag = trade.enter_tag
+            open_date_utc = trade.open_date_utc
+            cols = self._cols
+            key_to_idx = self._key_to_idx
+            
+            trade_key = self._generate_trade_key(enter_tag, pair, open_date_utc)
+            
+            # A repeated entry for the same trade overwrites its row; its old
+            # candle leaves the cache so only candles of live rows are kept
+            idx = key_to_idx.get(trade_key)
+            if idx is not None:
+                old = self._details[idx]
+                old_key = old.get('candle_key')
+                if self._candle_cache.get(old_key) is old.get('entry_candle'):
+                    del self._candle_cache[old_key]
+            
+            # Convert candle to a dictionary, reusing an earlier conversion of
+            # the same bar so repeated entries share one dict
+            candle_date = candle.get('date')
+            if candle_date is None:
+                cache_key = None
+                candle_dict = self._convert_candle_to_dict(candle)
+            else:
+                cache_key = (pair, candle_date)
+                candle_dict = self._candle_cache.get(cache_key)
+                if candle_dict is None:
+                    candle_dict = self._convert_candle_to_dict(candle)
+                    self._candle_cache[cache_key] = candle_dict
+            
+            if idx is None:
+                idx = self._n
+                if idx == len(cols['profit']):
+                    self._grow()
+                self._n = idx + 1
+                key_to_idx[trade_key] = idx
+                self._trade_keys.append(trade_key)
+                self._details.append({})
             
-            # Convert candle to JSON-serializable dictionary
-            candle_dict = self._convert_candle_to_dict(candle)
+            profit_col = cols['profit']
+            prev_profit = profit_col[idx]
+            if prev_profit == prev_profit:
+                self._dirty = True  # Counted exit profit is being reset
+            cols['entry_price'][idx] = trade.open_rate
+            cols['amount'][idx] = trade.amount
+            # Will be filled during exit
+            profit_col[idx] = np.nan
+            cols['profit_abs'][idx] = np.nan
+            cols['exit_price'][idx] = np.nan
             
             # Store only the last candle (entry candle)
-            self.trade_data[trade_key] = {
+            self._details[idx] = {
                 'entry_candle': candle_dict,
-                'entry_price': float(trade.open_rate),
-                'entry_time': trade.open_date_utc.isoformat(),
+                'candle_key': cache_key,
+                'entry_time': open_date_utc.isoformat(),
                 'pair': pair,
-                'enter_tag': trade.enter_tag,
-                'amount': float(trade.amount),
-                'profit': None,  # Will be filled during exit
+                'enter_tag': enter_tag,
             }
             
-            logger.debug(f"Stored entry candle for trade: {trade_key}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stored entry candle for trade: %s", self._format_trade_key(trade_key))
             
         except Exception as e:
             logger.error(f"Error storing entry candle for {pair}: {str(e)}", exc_info=True)
@@ -176,111 +610,270 @@ class DataframeTradeStatistics:
         trade: Trade,
         exit_rate: float,
         exit_reason: str
-    ) -> None:
+    ) -> Optional[float]:
         """
         Store the profit when a trade is exited.
         
         Called from confirm_trade_exit() when exiting a trade.
-        If auto_save_on_exit is enabled, writes to JSON immediately.
+        If auto_save_on_exit is enabled, the exit is queued for the NDJSON log
+        and written with the next batch (see _save_incremental()).
         
         Args:
             pair (str): Trading pair (e.g., 'BTC/USDT')
             trade (Trade): The Freqtrade Trade object
             exit_rate (float): The rate at which the trade is being exited
             exit_reason (str): The reason for exit (e.g., 'exit_signal', 'stoploss')
+            
+        Returns:
+            Optional[float]: Profit ratio of the stored exit, or None if disabled,
+                the trade has no stored entry, or storing failed
         """
         if not self.enabled:
-            return
+            return None
         
         try:
             trade_key = self._generate_trade_key(trade.enter_tag, pair, trade.open_date_utc)
             
-            # Calculate profit ratio
-            profit_ratio = trade.calc_profit_ratio(exit_rate)
-            profit_abs = trade.calc_profit(exit_rate)
+            # Calculate profit ratio and absolute profit in one pass
+            profit = trade.calculate_profit(exit_rate)
+            profit_ratio = profit.profit_ratio
+            profit_abs = profit.profit_abs
             
-            if trade_key in self.trade_data:
-                self.trade_data[trade_key].update({
-                    'profit': float(profit_ratio),
-                    'profit_abs': float(profit_abs),
-                    'exit_price': float(exit_rate),
+            idx = self._key_to_idx.get(trade_key)
+            if idx is not None:
+                cols = self._cols
+                profit_col = cols['profit']
+                p = float(profit_ratio)
+                prev_profit = profit_col[idx]
+                if prev_profit == prev_profit:
+                    self._dirty = True  # Trade exited before, its profit is already counted
+                elif not self._dirty:
+                    self._profit_count += 1
+                    self._sum_profit += p
+                    if p > 0:
+                        self._pos_count += 1
+                    elif p < 0:
+                        self._neg_count += 1
+                    else:
+                        self._zero_count += 1
+                    if p < self._min_profit:
+                        self._min_profit = p
+                    if p > self._max_profit:
+                        self._max_profit = p
+                
+                profit_col[idx] = p
+                cols['profit_abs'][idx] = profit_abs
+                cols['exit_price'][idx] = exit_rate
+                self._details[idx].update({
                     'exit_reason': exit_reason,
                     'trade_duration_candles': trade.nr_of_successful_buys,
                 })
                 
-                logger.debug(
-                    f"Stored exit profit for trade {trade_key}: "
-                    f"profit_ratio={profit_ratio:.4f}, exit_reason={exit_reason}"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Stored exit profit for trade %s: profit_ratio=%.4f, exit_reason=%s",
+                        self._format_trade_key(trade_key), profit_ratio, exit_reason
+                    )
                 
-                # Auto-save to JSON if enabled (crash-safe, writes on each trade exit)
+                # Auto-save to NDJSON if enabled (crash-safe, batched trade exits)
                 if self.auto_save_on_exit:
-                    self._save_incremental()
+                    self._save_incremental(idx)
             else:
                 logger.warning(
-                    f"Trade key {trade_key} not found in trade_data. "
+                    f"Trade key {self._format_trade_key(trade_key)} not found in trade_data. "
                     f"Entry candle may not have been stored."
                 )
+                return None
+            
+            return profit_ratio
         
         except Exception as e:
             logger.error(f"Error storing exit profit for {pair}: {str(e)}", exc_info=True)
+            return None
     
-    def _save_incremental(self) -> None:
+    def _encode_candle(self, candle_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Save current trade data to JSON incrementally.
+        Pack the float columns of a candle into one base64 float64 block.
+        
+        The block holds the values of self._numeric_keys in order ('<f8',
+        None stored as NaN) and decodes with
+        np.frombuffer(base64.b64decode(candle['num_b64']), dtype='<f8').
+        All other columns are kept as they are.
+        
+        Args:
+            candle_dict (Dict): Converted entry candle
+            
+        Returns:
+            Dict: {'num_b64': ..., **non-numeric columns}, or the candle
+                unchanged if it does not have the numeric columns
+        """
+        numeric_keys = self._numeric_keys
+        try:
+            numbers = np.array([candle_dict[key] for key in numeric_keys], dtype='<f8')
+        except (KeyError, TypeError, ValueError):
+            return candle_dict
+        
+        numeric = set(numeric_keys)
+        encoded = {'num_b64': base64.b64encode(numbers.tobytes()).decode()}
+        encoded.update((key, value) for key, value in candle_dict.items() if key not in numeric)
+        return encoded
+    
+    def _save_incremental(self, idx: int) -> None:
+        """
+        Queue an exited trade for the NDJSON log and flush the batch when due.
         
         Used when auto_save_on_exit is enabled.
-        Writes/updates JSON file each time a trade exits.
-        Creates a single working file that gets updated on each call.
+        The row is serialized right away and held in the pending batch; the
+        batch is written to a single working '.ndjson' file once 32 rows are
+        pending, or once the oldest pending row is older than 5 seconds when
+        the next exit arrives or flush_if_stale() is called. Without periodic
+        flush_if_stale() calls, a crash loses the exits since the last flush.
+        A trade exiting twice within a batch is logged once, with its last exit.
+        Aggregated metadata (win rate etc.) is only computed in export_to_json().
         Provides crash-safe backup during long backtests.
+        
+        Args:
+            idx (int): Row of the exited trade
         """
         if not self.enabled or not self.auto_save_on_exit:
             return
         
-        try:
-            # Use a single working file that gets updated
-            if self._current_export_file is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                self._current_export_file = self.output_dir / f"{self.strategy_name}_{timestamp}.json"
-            
-            # Calculate statistics for metadata
-            profits = [
-                t['profit'] for t in self.trade_data.values()
-                if t.get('profit') is not None
-            ]
-            trades_with_profit = sum(1 for p in profits if p > 0)
-            
-            export_data = {
-                'metadata': {
-                    'last_update': datetime.now().isoformat(),
-                    'total_trades': len(self.trade_data),
-                    'trades_with_profit': trades_with_profit,
-                    'win_rate': f"{(trades_with_profit / len(profits) * 100):.2f}%" if profits else "0.00%",
-                    'mode': 'incremental',
-                },
-                'trades': self.trade_data
-            }
+        pending = self._log.pending
+        # The deadline belongs to the oldest pending exit, so a trade exiting
+        # again while it is the only pending one does not push it back
+        if not pending:
+            self._flush_deadline = time.monotonic() + self._flush_interval
+        entry = self._serialize_row(idx)
+        if entry is not None:
+            pending[idx] = entry
+        
+        if (
+            len(pending) >= self._flush_threshold
+            or time.monotonic() >= self._flush_deadline
+        ):
+            self.flush()
+    
+    def _serialize_row(self, idx: int) -> Optional[Tuple[tuple, bytes]]:
+        """
+        Serialize one row as an NDJSON record.
+        
+        Numeric entry candle columns are stored as a base64 float64 block (see
+        _encode_candle()). _NdjsonLog.take_batch() writes their names as a
+        {"numeric_schema": [...]} line before the first record that uses them.
+        
+        Args:
+            idx (int): Row to serialize
             
-            # Write with atomic operation (safe across platforms)
-            with open(self._current_export_file, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+        Returns:
+            Optional[Tuple]: (numeric columns packed into the record, NDJSON line),
+                or None if the row cannot be serialized (it is logged and dropped)
+        """
+        trade_key = self._format_trade_key(self._trade_keys[idx])
+        record = self._trade_record(idx)
+        numeric_keys = ()
+        if self._numeric_keys:
+            record['entry_candle'] = self._encode_candle(record['entry_candle'])
+            if 'num_b64' in record['entry_candle']:
+                numeric_keys = self._numeric_keys
+        try:
+            line = orjson.dumps(
+                {'key': trade_key, **record},
+                default=_json_default,
+                option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError as e:  # orjson.JSONEncodeError
+            # Drop the row rather than retrying it on every later flush
+            logger.error(f"Dropping trade {trade_key} from the NDJSON log: {str(e)}", exc_info=True)
+            return None
+        return numeric_keys, line
+    
+    def _submit_write(self, write: Callable[..., None], *args: Any) -> None:
+        """
+        Hand a file write over to the writer thread.
+        
+        Blocks on the oldest write while too many are in flight. Once the
+        pool no longer accepts work (interpreter shutdown) the write runs
+        in the calling thread instead.
+        
+        Args:
+            write (Callable): _append_to_log or _write_file
+            *args: Arguments for write
+        """
+        pending = self._pending_writes
+        while pending and (pending[0].done() or len(pending) >= self._max_pending_writes):
+            pending.popleft().result()
+        
+        try:
+            pending.append(self._writer_pool.submit(write, *args))
+        except RuntimeError:
+            write(*args)
+    
+    def _wait_for_writes(self) -> None:
+        """Block until every queued file write has finished."""
+        while self._pending_writes:
+            self._pending_writes.popleft().result()
+    
+    def flush(self) -> None:
+        """
+        Write all pending exits to the NDJSON log.
+        
+        The pending lines are joined here and handed to the writer thread,
+        which does a single O_APPEND write followed by fsync, so the log only
+        ever grows by whole lines. Called from _save_incremental() and
+        flush_if_stale() once a batch is due, and from on_backtest_end() and
+        export_to_json().
+        """
+        log = self._log
+        if not log.pending:
+            return
+        
+        try:
+            count = len(log.pending)
+            self._submit_write(_append_to_log, log.open(), log.take_batch())
             
-            logger.debug(f"Incremental save: {len(self.trade_data)} trades to {self._current_export_file}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Incremental save: %d trades to %s", count, log.path)
         
         except Exception as e:
             logger.error(f"Error during incremental save: {str(e)}", exc_info=True)
     
+    def flush_if_stale(self) -> None:
+        """
+        Write pending exits once the oldest of them is older than the flush interval.
+        
+        The deadline is otherwise only checked when another trade exits, so
+        call this periodically (e.g. from bot_loop_start()) to bound how long
+        an exit can stay in memory when exits are hours apart.
+        """
+        if self._log.pending and time.monotonic() >= self._flush_deadline:
+            self.flush()
+    
+    def on_backtest_end(self) -> None:
+        """
+        Flush pending exits, wait for the writer thread and close the NDJSON log.
+        
+        Call this once after backtest completes. If the strategy never gets
+        the chance to, the collector's finalizer does the same when it is
+        garbage collected or the interpreter exits.
+        """
+        self.flush()
+        self._wait_for_writes()
+        self._log.close()
+    
     def export_to_json(self, output_path: Optional[str] = None) -> str:
         """
         Export all collected trade statistics to a JSON file.
         
         Call this method once after backtest completes.
+        The export is serialized in the calling thread and written by the
+        writer thread; the method returns once the file is complete.
         - In batch mode: Creates final export file with all trades
-        - In auto-save mode: Creates clean consolidated file (incremental already exists)
+        - In auto-save mode: Creates clean consolidated file (NDJSON log already exists)
         
         Args:
             output_path (Optional[str]): Path where JSON file will be saved.
-                If None, uses 'trade_statistics_<timestamp>.json' in output_dir.
+                If None, uses '<strategy_name>_<timestamp>.json' in output_dir, next to
+                the NDJSON log.
                 
         Returns:
             str: Path to the generated JSON file
@@ -288,45 +881,47 @@ class DataframeTradeStatistics:
         Raises:
             IOError: If file cannot be written
         """
-        if not self.trade_data:
+        if not self._n:
             logger.warning("No trade data to export")
             return ""
         
         try:
             if output_path is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_path = str(self.output_dir / f"{self.strategy_name}_{timestamp}.json")
+                output_path = str(self._default_export_file)
             else:
                 output_path = str(output_path)
             
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
+            # Make sure the NDJSON log is complete before the consolidated export
+            self.flush()
+            
             # Calculate statistics for metadata
-            profits = [
-                t['profit'] for t in self.trade_data.values()
-                if t.get('profit') is not None
-            ]
-            trades_with_profit = sum(1 for p in profits if p > 0)
-            win_rate = f"{(trades_with_profit / len(profits) * 100):.2f}%" if profits else "0.00%"
+            summary = self.get_statistics_summary()
             
             # Prepare export data with enhanced structure
             export_data = {
                 'metadata': {
                     'export_time': datetime.now().isoformat(),
-                    'total_trades': len(self.trade_data),
-                    'trades_with_profit': trades_with_profit,
-                    'win_rate': win_rate,
+                    'total_trades': summary['total_trades'],
+                    'trades_with_profit': summary['trades_with_profit'],
+                    'win_rate': summary['win_rate'],
                     'mode': 'final_export',
                 },
-                'trades': self.trade_data
+                'trades': self._trade_records()
             }
             
-            # Write to JSON with pretty formatting
-            with open(output_file, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            # Serialize to JSON with pretty formatting, then hand the write off
+            payload = orjson.dumps(
+                export_data,
+                default=_json_default,
+                option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2,
+            )
+            self._submit_write(_write_file, output_file, payload)
+            self._wait_for_writes()
             
-            logger.info(f"Exported {len(self.trade_data)} trades to {output_file}")
+            logger.info(f"Exported {self._n} trades to {output_file}")
             return str(output_file)
         
         except IOError as e:
@@ -337,7 +932,8 @@ class DataframeTradeStatistics:
         """
         Get a summary of collected trade statistics.
         
-        Can be called anytime to get current stats.
+        Can be called anytime to get current stats. Reads the running
+        statistics kept up to date by store_exit_profit(), so it is O(1).
         
         Returns:
             Dict with summary statistics including:
@@ -353,7 +949,7 @@ class DataframeTradeStatistics:
             - min_profit: Lowest profit ratio
             - max_profit: Highest profit ratio
         """
-        if not self.trade_data:
+        if not self._n:
             return {
                 'total_trades': 0,
                 'trades_with_exit_data': 0,
@@ -368,30 +964,27 @@ class DataframeTradeStatistics:
                 'max_profit': 0.0,
             }
         
-        profits = [
-            t['profit'] for t in self.trade_data.values()
-            if t.get('profit') is not None
-        ]
+        if self._dirty:
+            self._recount_profits()
         
-        profitable = sum(1 for p in profits if p > 0)
-        losing = sum(1 for p in profits if p < 0)
-        breakeven = sum(1 for p in profits if p == 0)
-        total_profit = sum(profits) if profits else 0.0
-        avg_profit = total_profit / len(profits) if profits else 0.0
-        win_rate = f"{(profitable / len(profits) * 100):.2f}%" if profits else "0.00%"
+        exited = self._profit_count
+        profitable = self._pos_count
+        total_profit = self._sum_profit
+        avg_profit = total_profit / exited if exited else 0.0
+        win_rate = f"{(profitable / exited * 100):.2f}%" if exited else "0.00%"
         
         return {
-            'total_trades': len(self.trade_data),
-            'trades_with_exit_data': len(profits),
+            'total_trades': self._n,
+            'trades_with_exit_data': exited,
             'trades_with_profit': profitable,
             'profitable_trades': profitable,
-            'losing_trades': losing,
-            'breakeven_trades': breakeven,
+            'losing_trades': self._neg_count,
+            'breakeven_trades': self._zero_count,
             'win_rate': win_rate,
             'avg_profit': float(avg_profit),
             'total_profit': float(total_profit),
-            'min_profit': float(min(profits)) if profits else 0.0,
-            'max_profit': float(max(profits)) if profits else 0.0,
+            'min_profit': float(self._min_profit) if exited else 0.0,
+            'max_profit': float(self._max_profit) if exited else 0.0,
         }
     
     def clear(self) -> None:
@@ -400,17 +993,18 @@ class DataframeTradeStatistics:
         
         Useful for running multiple backtests in sequence.
         """
-        self.trade_data.clear()
-        self._current_export_file = None
+        self.on_backtest_end()
+        self._reset_storage()
+        self._start_export_files()
         logger.info("Cleared all trade statistics data")
     
     def __len__(self) -> int:
         """Return the number of trades currently stored."""
-        return len(self.trade_data)
+        return self._n
     
     def __repr__(self) -> str:
         """String representation of the statistics collector."""
         return (
             f"DataframeTradeStatistics(enabled={self.enabled}, "
-            f"auto_save={self.auto_save_on_exit}, trades={len(self.trade_data)})"
+            f"auto_save={self.auto_save_on_exit}, trades={self._n})"
         )
@@ -209,7 +209,7 @@ class ExampleStrategy(IStrategy):
                     
                     # Get the last candle with all indicators
                     if len(dataframe) > 0:
-                        last_candle = dataframe.iloc[-1].squeeze()
+                        last_candle = dataframe.iloc[-1]
                         
                         # Store the entry candle
                         self.trade_stats.store_entry_dataframe(
@@ -219,11 +219,13 @@ class ExampleStrategy(IStrategy):
                             current_time=current_time
                         )
                         
-                        logger.debug(
-                            f"Captured entry for {pair}: "
-                            f"RSI={last_candle.get('rsi', 'N/A'):.2f}, "
-                            f"Price={last_candle.get('close', 'N/A'):.4f}"
-                        )
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Captured entry for %s: RSI=%.2f, Price=%.4f",
+                                pair,
+                                last_candle.get('rsi', float('nan')),
+                                last_candle.get('close', float('nan'))
+                            )
                 
                 except Exception as e:
                     logger.error(f"Error capturing entry candle for {pair}: {str(e)}")
@@ -239,19 +241,19 @@ class ExampleStrategy(IStrategy):
         
         if self.trade_stats.enabled:
             try:
-                self.trade_stats.store_exit_profit(
+                profit = self.trade_stats.store_exit_profit(
                     pair=pair,
                     trade=trade,
                     exit_rate=rate,
                     exit_reason=exit_reason
                 )
                 
-                profit = trade.calc_profit_ratio(rate)
-                logger.debug(
-                    f"Stored exit for {pair}: "
-                    f"Profit={profit:.2%}, "
-                    f"Reason={exit_reason}"
-                )
+                # Reuse the profit ratio computed while storing the exit
+                if profit is not None and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Stored exit for %s: Profit=%.2f%%, Reason=%s",
+                        pair, profit * 100, exit_reason
+                    )
             
             except Exception as e:
                 logger.error(f"Error storing exit profit for {pair}: {str(e)}")
@@ -261,9 +263,13 @@ class ExampleStrategy(IStrategy):
     def bot_loop_start(self, current_time: datetime, **kwargs) -> None:
         """
         Called at the start of every bot loop.
-        Log current statistics.
+        Write stale exits to the NDJSON log and log current statistics.
         """
         
+        if self.trade_stats.enabled:
+            # Exits can be hours apart, so don't leave a batch waiting in memory
+            self.trade_stats.flush_if_stale()
+        
         if self.trade_stats.enabled and len(self.trade_stats) > 0:
             stats = self.trade_stats.get_statistics_summary()
             logger.info(